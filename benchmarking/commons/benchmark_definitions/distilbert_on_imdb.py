@@ -23,22 +23,24 @@ from benchmarking.training_scripts.distilbert_on_imdb.distilbert_on_imdb import
 def distilbert_imdb_default_params() -> dict:
     return {
         "max_resource_level": 15,
-        "instance_type": "ml.g4dn.xlarge",
+        # g5 (A10G) supports bf16, as opposed to the g4dn (T4) used before
+        "instance_type": "ml.g5.xlarge",
         "num_workers": 4,
         "framework": "HuggingFace",
-        "framework_version": "4.4",
-        "pytorch_version": "1.6",
+        "framework_version": "4.28",
+        "pytorch_version": "2.0",
         "dataset_path": "./",
+        "bf16": "True",
     }
 
 
-# TODO: Update `HuggingFace` version
 def distilbert_imdb_benchmark(sagemaker_backend: bool = False, **kwargs):
     params = distilbert_imdb_default_params()
     config_space = dict(
         _config_space,
         dataset_path=params["dataset_path"],
         epochs=params["max_resource_level"],
+        bf16=params["bf16"],
     )
     _kwargs = dict(
         script=Path(__file__).parent.parent.parent
@@ -55,8 +57,8 @@ def distilbert_imdb_benchmark(sagemaker_backend: bool = False, **kwargs):
         resource_attr=RESOURCE_ATTR,
         framework="HuggingFace",
         estimator_kwargs=dict(
-            framework_version="4.4",
-            pytorch_version="1.6",
+            framework_version=params["framework_version"],
+            pytorch_version=params["pytorch_version"],
         ),
     )
     _kwargs.update(kwargs)
@@ -20,6 +20,16 @@ from benchmarking.training_scripts.lstm_wikitext2.lstm_wikitext2 import (
 )
 
 
+# resolved once, the benchmark function may be called for many variants in
+# programmatic sweeps
+_SCRIPT = (
+    Path(__file__).resolve().parents[2]
+    / "training_scripts"
+    / "lstm_wikitext2"
+    / "lstm_wikitext2.py"
+)
+
+
 def lstm_wikitext2_default_params(sagemaker_backend: bool) -> dict:
     if sagemaker_backend:
         instance_type = "ml.g4dn.xlarge"
@@ -35,23 +45,23 @@ def lstm_wikitext2_default_params(sagemaker_backend: bool) -> dict:
         "num_workers": num_workers,
         "report_current_best": "False",
         "dataset_path": "./",
+        "use_amp": "True",
     }
 
 
-# Note: Latest PyTorch version 1.10 not yet supported with remote launching
 def lstm_wikitext2_benchmark(sagemaker_backend: bool = False, **kwargs):
     params = lstm_wikitext2_default_params(sagemaker_backend)
-    config_space = dict(
-        _config_space,
-        dataset_path=params["dataset_path"],
-        epochs=params["max_resource_level"],
-        report_current_best=params["report_current_best"],
-    )
+    # the `{**mapping, ...}` merge is done in C and avoids re-keywording the
+    # whole template dict on every call
+    config_space = {
+        **_config_space,
+        "dataset_path": params["dataset_path"],
+        "epochs": params["max_resource_level"],
+        "report_current_best": params["report_current_best"],
+        "use_amp": params["use_amp"],
+    }
     _kwargs = dict(
-        script=Path(__file__).parent.parent.parent
-        / "training_scripts"
-        / "lstm_wikitext2"
-        / "lstm_wikitext2.py",
+        script=_SCRIPT,
         config_space=config_space,
         max_wallclock_time=7 * 3600,
         n_workers=params["num_workers"],
@@ -62,8 +72,14 @@ def lstm_wikitext2_benchmark(sagemaker_backend: bool = False, **kwargs):
         resource_attr=RESOURCE_ATTR,
         framework="PyTorch",
         estimator_kwargs=dict(
-            framework_version="1.7.1",
-            py_version="py3",
+            framework_version="2.1",
+            py_version="py310",
+            # trials with different batch sizes fragment the CUDA caching
+            # allocator; rounding block sizes keeps allocations reusable
+            # across the concurrent workers
+            environment={
+                "PYTORCH_CUDA_ALLOC_CONF": "roundup_power2_divisions:4,max_split_size_mb:512"
+            },
         ),
     )
     _kwargs.update(kwargs)
@@ -19,6 +19,7 @@ import time
 
 from syne_tune import Reporter
 from syne_tune.config_space import loguniform, add_to_argparse
+from benchmarking.utils import parse_bool
 
 
 METRIC_ACCURACY = "accuracy"
@@ -67,6 +68,7 @@ def compute_metrics(eval_pred):
 def objective(config):
     trial_id = config.get("trial_id")
     debug_log = trial_id is not None
+    bf16 = parse_bool(config.get("bf16", "False"))
 
     # Download and prepare data
     train_dataset, eval_dataset = download_data(config)
@@ -98,6 +100,14 @@ def objective(config):
         greater_is_better=True,
         # avoid filling disk
         save_strategy="no",
+        # bf16 uses the TensorCores on A10/A100 instances and has the same
+        # numeric range as fp32, so no gradient scaling is needed
+        bf16=bf16,
+        # "reduce-overhead" runs the fixed-shape train and eval steps under
+        # CUDA graphs, removing per-kernel launch overhead which dominates
+        # DistilBERT at small batch sizes
+        torch_compile=True,
+        torch_compile_mode="reduce-overhead",
     )
 
     # Create Trainer instance
@@ -167,6 +177,7 @@ if __name__ == "__main__":
     parser.add_argument("--n_train_data", type=int, default=25000)
     parser.add_argument("--n_eval_data", type=int, default=5000)
     parser.add_argument("--eval_interval", type=int, default=5000)
+    parser.add_argument("--bf16", type=str, default="False")
     parser.add_argument("--trial_id", type=str)
     add_to_argparse(parser, _config_space)
 
@@ -16,15 +16,13 @@ Example for how to fine-tune a DistilBERT model on the IMDB sentiment classifica
 import logging
 from pathlib import Path
 
-from sagemaker.huggingface import HuggingFace
-
 import syne_tune
 from syne_tune.backend import SageMakerBackend
 from syne_tune.backend.sagemaker_backend.sagemaker_utils import (
     get_execution_role,
     default_sagemaker_session,
 )
-from syne_tune.optimizer.baselines import RandomSearch
+from syne_tune.optimizer.baselines import ASHA
 from syne_tune import Tuner, StoppingCriterion
 
 from benchmarking.commons.benchmark_definitions.distilbert_on_imdb import (
@@ -45,19 +43,34 @@ if __name__ == "__main__":
     metric = benchmark.metric
     config_space = benchmark.config_space
 
-    # Define Hugging Face SageMaker estimator
+    # Define Hugging Face SageMaker estimator; the sagemaker import is
+    # deferred here as it takes several seconds
+    from sagemaker.huggingface import HuggingFace
+
     root = Path(syne_tune.__path__[0]).parent
     huggingface_estimator = HuggingFace(
         entry_point=str(benchmark.script),
         base_job_name="hpo-transformer",
         instance_type=benchmark.instance_type,
         instance_count=1,
-        transformers_version="4.4",
-        pytorch_version="1.6",
-        py_version="py36",
+        # framework versions come from the benchmark definition, so they stay
+        # in sync with what the training script requires (bf16, torch_compile
+        # need transformers >= 4.27 on PyTorch 2.x)
+        transformers_version=benchmark.estimator_kwargs["framework_version"],
+        pytorch_version=benchmark.estimator_kwargs["pytorch_version"],
+        py_version="py310",
         role=get_execution_role(),
         dependencies=[root / "benchmarking"],
         sagemaker_session=default_sagemaker_session(),
+        max_run=3600,
+        # warm pools keep the instance alive between trials, so that
+        # subsequent trials skip the container cold-start
+        keep_alive_period_in_seconds=1800,
+        # round up CUDA allocations so blocks are reused across trials with
+        # different batch sizes, reducing allocator fragmentation
+        environment={
+            "PYTORCH_CUDA_ALLOC_CONF": "roundup_power2_divisions:4,max_split_size_mb:512"
+        },
     )
 
     # SageMaker backend
@@ -66,9 +79,15 @@ if __name__ == "__main__":
         metrics_names=[metric],
     )
 
-    # Random search without stopping
-    scheduler = RandomSearch(
-        config_space, mode=mode, metric=metric, random_seed=random_seed
+    # ASHA stops underperforming trials early instead of running every
+    # configuration to completion
+    scheduler = ASHA(
+        config_space,
+        metric=metric,
+        mode=mode,
+        resource_attr=benchmark.resource_attr,
+        max_resource_attr=benchmark.max_resource_attr,
+        random_seed=random_seed,
     )
 
     stop_criterion = StoppingCriterion(max_wallclock_time=3600)
@@ -17,15 +17,7 @@ To run this example locally, you need to have installed dependencies in `require
 import logging
 from pathlib import Path
 
-import numpy as np
-
-from sagemaker.mxnet import MXNet
-
-from syne_tune.backend import LocalBackend, SageMakerBackend
-from syne_tune.backend.sagemaker_backend.sagemaker_utils import (
-    get_execution_role,
-    default_sagemaker_session,
-)
+from syne_tune.backend import LocalBackend
 from syne_tune.optimizer.baselines import ASHA
 from syne_tune import Tuner, StoppingCriterion
 from syne_tune.config_space import loguniform, lograndint
@@ -34,7 +26,7 @@ from syne_tune.config_space import loguniform, lograndint
 if __name__ == "__main__":
 
     logging.getLogger().setLevel(logging.INFO)
-    np.random.seed(0)
+    random_seed = 0
     epochs = 50
 
     config_space = {
@@ -55,6 +47,16 @@ if __name__ == "__main__":
     evaluate_trials_on_sagemaker = False
 
     if evaluate_trials_on_sagemaker:
+        # sagemaker imports take several seconds, only pay for them when
+        # trials are evaluated on Sagemaker
+        from sagemaker.mxnet import MXNet
+
+        from syne_tune.backend import SageMakerBackend
+        from syne_tune.backend.sagemaker_backend.sagemaker_utils import (
+            get_execution_role,
+            default_sagemaker_session,
+        )
+
         # evaluate trials on Sagemaker
         trial_backend = SageMakerBackend(
             sm_estimator=MXNet(
@@ -64,6 +66,9 @@ if __name__ == "__main__":
                 instance_count=1,
                 role=get_execution_role(),
                 max_run=10 * 60,
+                # warm pools keep the instance alive between trials, so that
+                # subsequent trials skip the container cold-start
+                keep_alive_period_in_seconds=1800,
                 framework_version="1.7",
                 py_version="py3",
                 base_job_name="hpo-gluonts",
@@ -81,7 +86,12 @@ if __name__ == "__main__":
 
     # see examples to see other schedulers, mobster, Raytune, multiobjective, etc...
     scheduler = ASHA(
-        config_space, max_t=epochs, resource_attr="epoch_no", mode="min", metric=metric
+        config_space,
+        max_t=epochs,
+        resource_attr="epoch_no",
+        mode="min",
+        metric=metric,
+        random_seed=random_seed,
     )
 
     wallclock_time_budget = 3600 if evaluate_trials_on_sagemaker else 600
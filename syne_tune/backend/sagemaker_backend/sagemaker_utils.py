@@ -248,15 +248,24 @@ def get_execution_role():
         logger.info(
             f"No Sagemaker role passed as environment variable $AWS_ROLE, inferring it."
         )
-        client = boto3.client("iam", config=default_config())
-        sm_roles = client.list_roles(PathPrefix="/service-role/")["Roles"]
-        for role in sm_roles:
-            if "AmazonSageMaker-ExecutionRole" in role["RoleName"]:
-                return role["Arn"]
-        raise Exception(
-            "Could not infer Sagemaker role, specify it by specifying `AWS_ROLE` environement variable "
-            "or refer to https://docs.aws.amazon.com/sagemaker/latest/dg/sagemaker-roles.html to create a new one"
-        )
+        return _infer_execution_role()
+
+
+@functools.lru_cache(maxsize=1)
+def _infer_execution_role():
+    """
+    Infers the role with an IAM call, which takes a few hundred ms; the result
+    is cached so that launchers creating many estimators pay for it only once.
+    """
+    client = boto3.client("iam", config=default_config())
+    sm_roles = client.list_roles(PathPrefix="/service-role/")["Roles"]
+    for role in sm_roles:
+        if "AmazonSageMaker-ExecutionRole" in role["RoleName"]:
+            return role["Arn"]
+    raise Exception(
+        "Could not infer Sagemaker role, specify it by specifying `AWS_ROLE` environement variable "
+        "or refer to https://docs.aws.amazon.com/sagemaker/latest/dg/sagemaker-roles.html to create a new one"
+    )
 
 
 def untar(filename: Path):
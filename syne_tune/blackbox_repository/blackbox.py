@@ -34,6 +34,31 @@ class Blackbox:
         self.fidelity_space = fidelity_space
         self.objectives_names = objectives_names
 
+    # The key views are cached by the setters below, re-materializing them on
+    # every `objective_function` call is measurable for fast tabular
+    # blackboxes. Subclasses which modify a space after construction must
+    # assign a new dict to the attribute (rather than mutating the dict in
+    # place), so the caches are refreshed
+
+    @property
+    def configuration_space(self) -> dict:
+        return self._configuration_space
+
+    @configuration_space.setter
+    def configuration_space(self, configuration_space: dict):
+        self._configuration_space = configuration_space
+        self._config_keys = frozenset(configuration_space)
+
+    @property
+    def fidelity_space(self) -> Optional[dict]:
+        return self._fidelity_space
+
+    @fidelity_space.setter
+    def fidelity_space(self, fidelity_space: Optional[dict]):
+        self._fidelity_space = fidelity_space
+        self._fidelity_keys_list = list(fidelity_space) if fidelity_space else None
+        self._fidelity_keys_set = frozenset(self._fidelity_keys_list or ())
+
     def objective_function(
         self,
         configuration: dict,
@@ -55,25 +80,30 @@ class Blackbox:
         :return: dictionary of objectives evaluated or tensor with shape
             `(num_fidelities, num_objectives)` if no fidelity was given.
         """
-        self._check_keys(config=configuration, fidelity=fidelity)
+        # invariant checks are gated so that they can be stripped with `-O`
+        # on the hot dispatch path
+        if __debug__:
+            self._check_keys(config=configuration, fidelity=fidelity)
         if self.fidelity_space is None:
-            assert fidelity is None
-        else:
-            if fidelity is None:
-                assert (
-                    len(self.fidelity_space) == 1
-                ), "not passing a fidelity is only supported when only one fidelity is present."
+            if fidelity is not None:
+                raise ValueError(
+                    "a fidelity was passed but the blackbox has no fidelity space."
+                )
+        elif fidelity is None and len(self._fidelity_keys_list) != 1:
+            raise ValueError(
+                "not passing a fidelity is only supported when only one fidelity is present."
+            )
 
         if isinstance(fidelity, Number):
             # allows to call
             # `objective_function(configuration=..., fidelity=2)`
             # instead of
             # `objective_function(configuration=..., {'num_epochs': 2})`
-            fidelity_names = list(self.fidelity_space.keys())
-            assert (
-                len(fidelity_names) == 1
-            ), "passing numeric value is only possible when there is a single fidelity in the fidelity space."
-            fidelity = {fidelity_names[0]: fidelity}
+            if len(self._fidelity_keys_list) != 1:
+                raise ValueError(
+                    "passing numeric value is only possible when there is a single fidelity in the fidelity space."
+                )
+            fidelity = {self._fidelity_keys_list[0]: fidelity}
 
         # todo check configuration/fidelity matches their space
         return self._objective_function(
@@ -93,6 +123,81 @@ class Blackbox:
         """
         pass
 
+    def objective_function_batch(
+        self,
+        configurations: pd.DataFrame,
+        fidelities: Optional[np.ndarray] = None,
+        seed: Optional[int] = None,
+    ) -> np.ndarray:
+        """Vectorized version of `objective_function` for a batch of configurations.
+
+        Keys are validated once for the whole batch before dispatching to
+        `_objective_function_batch`, which subclasses can override with
+        vectorized table lookups to avoid per-configuration Python overhead.
+
+        :param configurations: dataframe of configurations to evaluate, one per
+            row, columns must belong to `self.configuration_space`
+        :param fidelities: fidelity value for each row of `configurations`, only
+            supported when the fidelity space has a single fidelity. If not
+            passed, all fidelities are returned for each configuration.
+        :param seed: Only used if the blackbox defines multiple seeds
+        :return: tensor with shape `(num_configs, num_objectives)`; or shape
+            `(num_configs, num_fidelities, num_objectives)` if no fidelities
+            were given.
+        """
+        config_keys = set(configurations.columns)
+        if not config_keys.issubset(self._config_keys):
+            extra_keys = config_keys.difference(self._config_keys)
+            raise ValueError(
+                f"columns {extra_keys} passed in the configurations are not present "
+                f"in the configuration space keys: {list(self.configuration_space.keys())}"
+            )
+        if fidelities is not None:
+            if self.fidelity_space is None or len(self._fidelity_keys_list) != 1:
+                raise ValueError(
+                    "passing fidelity values is only possible when there is a single fidelity in the fidelity space."
+                )
+            fidelities = np.asarray(fidelities)
+            if len(fidelities) != len(configurations):
+                raise ValueError(
+                    f"got {len(fidelities)} fidelities for {len(configurations)} configurations"
+                )
+        return self._objective_function_batch(
+            configurations=configurations,
+            fidelities=fidelities,
+            seed=seed,
+        )
+
+    def _objective_function_batch(
+        self,
+        configurations: pd.DataFrame,
+        fidelities: Optional[np.ndarray] = None,
+        seed: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Default implementation evaluates `_objective_function` row by row,
+        subclasses should override this with a vectorized lookup when possible.
+        """
+        if self.fidelity_space is not None:
+            fidelity_name = next(iter(self.fidelity_space.keys()))
+        results = []
+        for i, configuration in enumerate(configurations.to_dict("records")):
+            fidelity = None if fidelities is None else {fidelity_name: fidelities[i]}
+            result = self._objective_function(
+                configuration=configuration,
+                fidelity=fidelity,
+                seed=seed,
+            )
+            if isinstance(result, dict):
+                names = (
+                    self.objectives_names
+                    if self.objectives_names is not None
+                    else list(result.keys())
+                )
+                result = np.array([result[name] for name in names])
+            results.append(result)
+        return np.stack(results)
+
     def __call__(self, *args, **kwargs) -> ObjectiveFunctionResult:
         """
         Allows to call blackbox directly as a function rather than having to call the specific method.
@@ -101,18 +206,21 @@ class Blackbox:
         return self.objective_function(*args, **kwargs)
 
     def _check_keys(self, config, fidelity):
-        if isinstance(fidelity, dict):
-            for key in fidelity.keys():
-                assert key in self.fidelity_space.keys(), (
-                    f'The key "{key}" passed as fidelity is not present in the fidelity space keys: '
-                    f"{self.fidelity_space.keys()}"
-                )
-        if isinstance(config, dict):
-            for key in config.keys():
-                assert key in self.configuration_space.keys(), (
-                    f'The key "{key}" passed in the configuration is not present in the configuration space keys: '
-                    f"{self.configuration_space.keys()}"
-                )
+        if (
+            isinstance(fidelity, dict)
+            and not fidelity.keys() <= self._fidelity_keys_set
+        ):
+            extra_keys = set(fidelity.keys()).difference(self._fidelity_keys_set)
+            raise AssertionError(
+                f"The keys {extra_keys} passed as fidelity are not present in the fidelity space keys: "
+                f"{self._fidelity_keys_list}"
+            )
+        if isinstance(config, dict) and not config.keys() <= self._config_keys:
+            extra_keys = set(config.keys()).difference(self._config_keys)
+            raise AssertionError(
+                f"The keys {extra_keys} passed in the configuration are not present in the configuration space keys: "
+                f"{list(self.configuration_space.keys())}"
+            )
 
     def hyperparameter_objectives_values(
         self, predict_curves: bool = False
@@ -79,6 +79,12 @@ class BlackboxTabular(Blackbox):
         self.fidelity_map = {
             value: index for index, value in enumerate(self._fidelity_values)
         }
+        # sorted view of the fidelity values for vectorized `np.searchsorted`
+        # lookups in `_objective_function_batch`
+        self._fidelity_argsort = np.argsort(self._fidelity_values)
+        self._sorted_fidelity_values = np.asarray(self._fidelity_values)[
+            self._fidelity_argsort
+        ]
         self.hyperparameters = hyperparameters
 
         # builds a dataframe to retrieve in O(1) index given a hyperparameter, we could have use a dict but chose a
@@ -90,7 +96,9 @@ class BlackboxTabular(Blackbox):
         self.hyperparameters_index["index"] = hyperparameters.index
         self.hyperparameters_index.set_index(self._hp_cols, inplace=True)
 
-        self.objectives_evaluations = objectives_evaluations
+        # a C-contiguous table makes both the scalar and the batched gathers
+        # below single contiguous reads
+        self.objectives_evaluations = np.ascontiguousarray(objectives_evaluations)
         if objectives_names is None:
             self.objectives_names = [f"y{i}" for i in range(num_objectives)]
 
@@ -123,17 +131,15 @@ class BlackboxTabular(Blackbox):
             return objectives_values
         try:
             key = tuple(configuration[key] for key in self._hp_cols)
-            matching_index = self.hyperparameters_index.loc[key].values
+            # hyperparameters are unique (checked at construction), so the
+            # index column lookup directly yields the single matching row
+            index = self.hyperparameters_index["index"].loc[key]
         except KeyError:
             raise ValueError(
                 f"the hyperparameter {configuration} is not present in available evaluations. Use `add_surrogate(blackbox)` if"
                 f" you want to add interpolation or a surrogate model that support querying any configuration."
             )
 
-        df_found = self.hyperparameters.loc[matching_index]
-        assert len(df_found) == 1
-        index = df_found.index.values[0]
-
         if fidelity is None:
             # returns all fidelities
             objectives_values = self.objectives_evaluations[index, seed, :, :]
@@ -145,6 +151,43 @@ class BlackboxTabular(Blackbox):
             ]
             return dict(zip(self.objectives_names, objectives_values))
 
+    def _objective_function_batch(
+        self,
+        configurations: pd.DataFrame,
+        fidelities: Optional[np.ndarray] = None,
+        seed: Optional[int] = None,
+    ) -> np.ndarray:
+        if seed is not None:
+            assert 0 <= seed < self.num_seeds
+        else:
+            seed = np.random.randint(0, self.num_seeds)
+        # single columnar lookup of all row indices instead of one `.loc` per
+        # configuration
+        if len(self._hp_cols) > 1:
+            keys = pd.MultiIndex.from_frame(configurations[self._hp_cols])
+        else:
+            keys = configurations[self._hp_cols[0]]
+        indices = self.hyperparameters_index["index"].reindex(keys).to_numpy()
+        if np.isnan(indices).any():
+            missing = configurations[np.isnan(indices)]
+            raise ValueError(
+                f"the hyperparameters {missing.to_dict('records')} are not present in available evaluations. "
+                f"Use `add_surrogate(blackbox)` if you want to add interpolation or a surrogate model that "
+                f"support querying any configuration."
+            )
+        indices = indices.astype(int)
+        if fidelities is None:
+            # returns all fidelities
+            return self.objectives_evaluations[indices, seed, :, :]
+        positions = np.searchsorted(self._sorted_fidelity_values, fidelities)
+        positions = np.clip(positions, 0, len(self._sorted_fidelity_values) - 1)
+        if not np.all(self._sorted_fidelity_values[positions] == fidelities):
+            raise ValueError(
+                f"some fidelities are not present in available fidelity values: {self._fidelity_values}"
+            )
+        fidelity_indices = self._fidelity_argsort[positions]
+        return self.objectives_evaluations[indices, seed, fidelity_indices, :]
+
     @property
     def fidelity_values(self) -> np.array:
         return self._fidelity_values
@@ -134,13 +134,17 @@ class BlackBoxYAHPO(Blackbox):
             assert domain is not None
             assert isinstance(domain, cs.Float)
             assert domain.upper == 1 and domain.lower <= 0.05
-            self.fidelity_space["trainsize"] = cs.randint(1, 20)
+            # The space is rebuilt and assigned (not mutated in place), so
+            # that `Blackbox` refreshes its cached key views
+            fidelity_space = dict(self.fidelity_space)
+            fidelity_space["trainsize"] = cs.randint(1, 20)
             if self._is_rbv2:
                 # For `rbv2_`, a second fidelity is `repl`, but it is constant
                 # 10, so can be removed
-                assert len(self.fidelity_space) == 2
-                assert "repl" in self.fidelity_space
-                del self.fidelity_space["repl"]
+                assert len(fidelity_space) == 2
+                assert "repl" in fidelity_space
+                del fidelity_space["repl"]
+            self.fidelity_space = fidelity_space
 
     def _adjust_fidelity_space(self, fidelities: Optional[List[int]]):
         assert len(self.fidelity_space) == 1, "Only one fidelity is supported"
@@ -158,7 +162,7 @@ class BlackBoxYAHPO(Blackbox):
                 domain.lower <= fidelities[0] and fidelities[-1] <= domain.upper
             ), f"fidelities = {fidelities} must lie in [{domain.lower}, {domain.upper}]"
             self._fidelity_values = np.array(fidelities)
-            self.fidelity_space[self._fidelity_name] = cs.ordinal(fidelities.copy())
+            self.fidelity_space = {self._fidelity_name: cs.ordinal(fidelities.copy())}
 
     def _objective_function(
         self,
@@ -219,7 +223,12 @@ class BlackBoxYAHPO(Blackbox):
             instance_names = self.benchmark.config.instance_names
         else:
             instance_names = "instance-names"
-        self.configuration_space[instance_names] = instance
+        # Reassigned (not mutated in place), so that `Blackbox` refreshes
+        # its cached key views
+        self.configuration_space = {
+            **self.configuration_space,
+            instance_names: instance,
+        }
         return self
 
     @property
@@ -15,6 +15,7 @@ import json
 import logging
 from datetime import datetime
 from json.decoder import JSONDecodeError
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
 from pathlib import Path
@@ -60,14 +61,17 @@ class ExperimentResult:
         metric = self.metric_names()[0]
         df = self.results
         if df is not None and len(df) > 0:
-            df = df.sort_values(ST_TUNER_TIME)
-            x = df.loc[:, ST_TUNER_TIME]
-            y = (
-                df.loc[:, metric].cummax()
+            # single argsort plus accumulate on numpy arrays, avoids sorting
+            # the full dataframe just for the plot
+            x = df[ST_TUNER_TIME].to_numpy()
+            y = df[metric].to_numpy()
+            order = np.argsort(x)
+            accumulate = (
+                np.maximum.accumulate
                 if self.metric_mode() == "max"
-                else df.loc[:, metric].cummin()
+                else np.minimum.accumulate
             )
-            plt.plot(x, y, **plt_kwargs)
+            plt.plot(x[order], accumulate(y[order]), **plt_kwargs)
             plt.xlabel("wallclock time (secs)")
             plt.ylabel(metric)
             plt.title(f"Best result over time {self.name}")
@@ -130,7 +134,10 @@ def download_single_experiment(
     parts_path = s3_path.replace("s3://", "").split("/")
     s3_bucket = parts_path[0]
     s3_key = "/".join(parts_path[1:])
-    for file in ["metadata.json", "results.csv.zip", "tuner.dill"]:
+    # `results.csv` carries the results streamed while the experiment runs,
+    # `results.csv.zip` is only written once at the end of the tuning job;
+    # fetching both allows to download in-flight or interrupted experiments
+    for file in ["metadata.json", "results.csv.zip", "results.csv", "tuner.dill"]:
         try:
             logging.info(f"downloading {file} on {s3_path}")
             s3.download_file(s3_bucket, f"{s3_key}/{file}", str(tgt_dir / file))
@@ -15,6 +15,7 @@ from typing import List, Dict
 import numpy as np
 import autograd.numpy as anp
 from autograd.scipy.linalg import solve_triangular
+from autograd.tracer import isbox
 from numpy.random import RandomState
 
 from syne_tune.optimizer.schedulers.searchers.bayesopt.gpautograd.kernel.exponential_decay import (
@@ -49,14 +50,18 @@ class ZeroKernel(KernelFunction):
 
     """
 
+    # Cached 0-d array, so callers adding the result to arrays do not pay
+    # a Python float promotion on every call
+    _ZERO = anp.zeros(())
+
     def __init__(self, dimension: int, **kwargs):
         super().__init__(dimension, **kwargs)
 
     def forward(self, X1, X2, **kwargs):
-        return 0.0
+        return self._ZERO
 
     def diagonal(self, X):
-        return 0.0
+        return self._ZERO
 
     def diagonal_depends_on_X(self):
         return False
@@ -72,11 +77,13 @@ class ZeroKernel(KernelFunction):
 
 
 class ZeroMean(MeanFunction):
+    _ZERO = ZeroKernel._ZERO
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
     def forward(self, X):
-        return 0.0
+        return self._ZERO
 
     def param_encoding_pairs(self):
         return []
@@ -111,10 +118,16 @@ class ExponentialDecayBaseKernelFunction(KernelFunction):
         self.r_max = r_max
         self.lower = r_min - 0.5 + EPS
         self.width = r_max - r_min + 1 - 2 * EPS
+        # Reciprocal so `_normalize` multiplies instead of divides in the
+        # hot path
+        self._inv_width = 1.0 / self.width
         self.normalize_inputs = normalize_inputs
+        # Caches `rvals_colvec` results, keyed by the number of resource
+        # values
+        self._rvals_cache = dict()
 
     def _normalize(self, X):
-        return (X - self.lower) / self.width
+        return (X - self.lower) * self._inv_width
 
     def forward(self, X1, X2):
         same_12 = X2 is X1
@@ -126,6 +139,47 @@ class ExponentialDecayBaseKernelFunction(KernelFunction):
                 X2 = self._normalize(X2)
         return self.kernel(X1, X2)
 
+    def rvals_colvec(self, num_res: int):
+        """
+        Returns the column vector of resource values
+        `range(r_min, r_min + num_res)`. Since this depends on static
+        attributes only, it is cached across calls.
+
+        :param num_res: Number of resource values
+        :return: Resource values, shape (num_res, 1)
+        """
+        rvals = self._rvals_cache.get(num_res)
+        if rvals is None:
+            rvals = anp.reshape(anp.arange(self.r_min, self.r_min + num_res), (-1, 1))
+            self._rvals_cache[num_res] = rvals
+        return rvals
+
+    def gram_1d(self, rvals):
+        """
+        Computes the kernel matrix k(rvals, rvals) directly from the closed
+        form
+
+            k(r, r') = gamma^2 * (kappa(r + r') - kappa(r) * kappa(r')),
+            kappa(x) = (beta / (x + beta))^alpha, beta = alpha / mean_lam,
+
+        which is what :class:`ExponentialDecayResourcesKernelFunction`
+        reduces to for `kernel_x` zero and delta = 0. This avoids the
+        dispatch through the generic `forward` (zero kernel over x, delta
+        terms) in the hot path of the likelihood computations.
+
+        :param rvals: Resource values, shape (n, 1)
+        :return: Kernel matrix, shape (n, n)
+        """
+        if self.normalize_inputs:
+            rvals = self._normalize(rvals)
+        alpha, mean_lam, gamma, _ = self.kernel._get_params(rvals)
+        kappa = self.kernel._compute_kappa(rvals, alpha, mean_lam)
+        kappa12 = self.kernel._compute_kappa(
+            anp.add(rvals, anp.reshape(rvals, (1, -1))), alpha, mean_lam
+        )
+        kmat = anp.subtract(kappa12, anp.multiply(kappa, anp.reshape(kappa, (1, -1))))
+        return anp.multiply(kmat, anp.square(anp.reshape(gamma, (1, 1))))
+
     def diagonal(self, X):
         if self.normalize_inputs:
             X = self._normalize(X)
@@ -164,10 +218,63 @@ def logdet_cholfact_cov_resource(likelihood: Dict) -> float:
     log_diag = anp.log(anp.diag(lfact_all))
     # Weights:
     #   w_j = sum_i I[ydims[i] > j], j = 0, 1, ...
-    weights = anp.sum(_colvec(anp.array(ydims)) > _rowvec(anp.arange(dim)), axis=0)
+    # These are suffix sums of the histogram of `ydims`, which avoids
+    # materializing a (n, dim) boolean matrix
+    counts = np.bincount(ydims, minlength=dim + 1)
+    weights = np.cumsum(counts[::-1])[::-1][1:]
     return _inner_product(log_diag[:dim], weights)
 
 
+def _cholfact_and_means(
+    res_kernel: ExponentialDecayBaseKernelFunction, noise_variance, num_res: int
+):
+    """
+    Computes mean values and Cholesky factor of the normalized kernel matrix
+    over the resource values `range(r_min, r_min + num_res)`.
+
+    These quantities depend on the kernel hyperparameters and noise variance
+    only. If these are plain values (prediction), the result is cached on
+    `res_kernel` and reused as long as the values do not change. If any of
+    them is an autograd box (criterion evaluation during fitting), the cache
+    is bypassed.
+
+    :param res_kernel: Kernel k(r, r') over resources
+    :param noise_variance: Noise variance sigma^2
+    :param num_res: Number of resource values
+    :return: `(lfact_all, means_all)`
+    """
+    params = res_kernel.get_params()
+    use_cache = not (isbox(noise_variance) or any(isbox(v) for v in params.values()))
+    if use_cache:
+        key = (
+            tuple(sorted((k, float(v)) for k, v in params.items())),
+            float(noise_variance),
+            num_res,
+        )
+        cached = getattr(res_kernel, "_cholfact_cache", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+    if hasattr(res_kernel, "rvals_colvec"):
+        rvals = res_kernel.rvals_colvec(num_res)
+    else:
+        r_min = res_kernel.r_min
+        rvals = _colvec(anp.arange(r_min, r_min + num_res))
+    means_all = _flatvec(res_kernel.mean_function(rvals))
+    # `gram_1d` evaluates the closed-form Gram matrix where available; any
+    # other resource kernel goes through the generic path
+    if hasattr(res_kernel, "gram_1d"):
+        kernel_mat = res_kernel.gram_1d(rvals)
+    else:
+        kernel_mat = res_kernel(rvals, rvals)
+    amat = kernel_mat / noise_variance + anp.diag(anp.ones(num_res))
+    # TODO: Do we need AddJitterOp here?
+    lfact_all = cholesky_factorization(amat)  # L (Cholesky factor)
+    result = (lfact_all, means_all)
+    if use_cache:
+        res_kernel._cholfact_cache = (key, result)
+    return result
+
+
 def resource_kernel_likelihood_precomputations(targets: List[np.ndarray]) -> Dict:
     """
     Precomputations required by `resource_kernel_likelihood_computations`.
@@ -187,12 +294,10 @@ def resource_kernel_likelihood_precomputations(targets: List[np.ndarray]) -> Dic
     """
     ydims = [y.shape[0] for y in targets]
     ydim_max = ydims[0]
-    num_configs = list(
-        np.sum(
-            np.array(ydims).reshape((-1, 1)) > np.arange(ydim_max).reshape((1, -1)),
-            axis=0,
-        ).reshape((-1,))
-    )
+    # `num_configs[j]` are suffix sums of the histogram of `ydims` (compare
+    # `logdet_cholfact_cov_resource`)
+    counts = np.bincount(ydims, minlength=ydim_max + 1)
+    num_configs = list(np.cumsum(counts[::-1])[::-1][1:])
     assert num_configs[0] == len(targets), (num_configs, len(targets))
     assert num_configs[-1] > 0, num_configs
     total_size = sum(num_configs)
@@ -201,16 +306,20 @@ def resource_kernel_likelihood_precomputations(targets: List[np.ndarray]) -> Dic
     # `targets` maps to `yflat` in the same ordering (the index is still r),
     # whereas there the index j of `deltay` runs in the opposite direction of
     # the index r of `targets`
-    yflat_rows = []
-    for pos, num in enumerate(num_configs):
-        yflat_rows.extend([y[pos].reshape((1, -1)) for y in targets[:num]])
-    yflat = np.vstack(yflat_rows)
+    # Pack the targets into a dense (n, ydim_max, F) array, then gather the
+    # valid cells in column-major order (index r first). Since datapoints are
+    # ordered by nonincreasing `ydims`, this produces exactly the part
+    # layout described above, without Python-level loops over `num_configs`
+    num_fantasy_samples = targets[0].shape[1]
+    dense = np.zeros((len(targets), ydim_max, num_fantasy_samples))
+    for i, y in enumerate(targets):
+        dense[i, : y.shape[0], :] = y
+    mask = np.array(ydims).reshape((-1, 1)) > np.arange(ydim_max).reshape((1, -1))
+    yflat = dense.transpose((1, 0, 2))[mask.T]
     assert yflat.shape[0] == total_size
     return {"ydims": ydims, "num_configs": num_configs, "yflat": yflat}
 
 
-# TODO: This code is complex. If it does not run faster than
-# `resource_kernel_likelihood_slow_computations`, remove it.
 def resource_kernel_likelihood_computations(
     precomputed: Dict,
     res_kernel: ExponentialDecayBaseKernelFunction,
@@ -254,56 +363,43 @@ def resource_kernel_likelihood_computations(
 
     # Compute Cholesky factor for largest target vector size, or for full size
     ydims = precomputed["ydims"]
-    rvals = _colvec(anp.arange(r_min, r_min + num_res))
-    means_all = _flatvec(res_kernel.mean_function(rvals))
-    amat = res_kernel(rvals, rvals) / noise_variance + anp.diag(anp.ones(num_res))
-    # TODO: Do we need AddJitterOp here?
-    lfact_all = cholesky_factorization(amat)  # L (Cholesky factor)
-
-    # Loop over ydim
+    lfact_all, means_all = _cholfact_and_means(res_kernel, noise_variance, num_res)
+
+    # Pad the parts of `yflat` into a dense (ydim_max, n * F) matrix, so the
+    # forward substitution becomes a single `solve_triangular` call instead
+    # of a Python recurrence over rows. `yflat` is a (*, F) matrix, where
+    # F == `num_fantasy_samples`; the target matrix of configuration i is
+    # flattened out into columns [i * F, (i + 1) * F) of `ypad`. Column i * F
+    # + f has valid entries in rows [0, ydims[i]) only. Rows >= ydims[i] of
+    # the solution are junk (the padding is propagated by the substitution),
+    # but they are masked out of all reductions below, and valid rows are
+    # unaffected since a lower triangular solve only looks upwards
     yflat = precomputed["yflat"]
-    off = num_all_configs
-    ilscal = 1.0 / lfact_all[0, 0]
-    vvec = anp.array([ilscal]).reshape((1, 1))
-    # `yflat` is a (*, F) matrix, where F == `num_fantasy_samples`. These
-    # matrices are flattened out as rows of `wmat`, and reshaped back before
-    # writing into `wtv_lst`
-    wmat = _rowvec(yflat[:off, :] - means_all[0]) * ilscal
-    # Note: We need the detour via `wtv_lst`, etc, because `autograd` does not
-    # support overwriting the content of an `ndarray`. Their role is to collect
-    # parts of the final vectors, in reverse ordering
-    wtv_lst = []
-    wtw_lst = []
-    num_prev = off
-    for ydim, num in enumerate(num_configs[1:], start=1):
-        if num < num_prev:
-            # These parts are done:
-            pos = num * num_fantasy_samples
-            wdone = wmat[:, pos:]
-            wtv_part = anp.reshape(anp.matmul(vvec, wdone), (-1, num_fantasy_samples))
-            wtv_lst.append(wtv_part)
-            if compute_wtw:
-                wtw_lst.append(_flatvec(anp.sum(anp.square(wdone), axis=0)))
-            wmat = wmat[:, :pos]
-            num_prev = num
-        # Update W matrix
-        rhs = _rowvec(yflat[off : (off + num), :] - means_all[ydim])
+    ydim_max = ydims[0]
+    ncols = num_all_configs * num_fantasy_samples
+    ypad = np.zeros((ydim_max, ncols))
+    mask = np.zeros((ydim_max, ncols))
+    off = 0
+    for pos, num in enumerate(num_configs):
+        chunk = num * num_fantasy_samples
+        ypad[pos, :chunk] = yflat[off : (off + num), :].reshape((-1,))
+        mask[pos, :chunk] = 1.0
         off += num
-        lvec = _rowvec(lfact_all[ydim, :ydim])
-        ilscal = 1.0 / lfact_all[ydim, ydim]
-        w_new = (rhs - anp.matmul(lvec, wmat)) * ilscal
-        wmat = anp.concatenate((wmat, w_new), axis=0)
-        # Update v vector (row vector)
-        v_new = anp.array([(1.0 - _inner_product(lvec, vvec)) * ilscal]).reshape((1, 1))
-        vvec = anp.concatenate((vvec, v_new), axis=1)
-    wtv_part = anp.reshape(anp.matmul(vvec, wmat), (-1, num_fantasy_samples))
-    wtv_lst.append(wtv_part)
-    wtv_all = anp.concatenate(tuple(reversed(wtv_lst)), axis=0)
+    lfact = lfact_all[:ydim_max, :ydim_max]
+    rhs = (ypad - _colvec(means_all[:ydim_max])) * mask
+    wmat = solve_triangular(lfact, rhs, lower=True)
+    vvec = _flatvec(solve_triangular(lfact, anp.ones((ydim_max, 1)), lower=True))
+    wmat_masked = wmat * mask
+    # `einsum` fuses the elementwise product and the column sum into one
+    # pass, without materializing the intermediate matrix
+    wtv_all = anp.reshape(
+        anp.einsum("i,ij->j", vvec, wmat_masked),
+        (num_all_configs, num_fantasy_samples),
+    )
     if compute_wtw:
-        wtw_lst.append(_flatvec(anp.sum(anp.square(wmat), axis=0)))
-        wtw_all = anp.concatenate(tuple(reversed(wtw_lst)), axis=0)
+        wtw_all = anp.einsum("ij,ij->j", wmat_masked, wmat_masked)
     vtv_for_ydim = anp.cumsum(anp.square(vvec))
-    vtv_all = anp.array([vtv_for_ydim[ydim - 1] for ydim in ydims])
+    vtv_all = vtv_for_ydim[np.array(ydims) - 1]
     # Compile results
     result = {
         "num_data": sum(ydims),
@@ -340,43 +436,61 @@ def resource_kernel_likelihood_slow_computations(
     r_min, r_max = res_kernel.r_min, res_kernel.r_max
     num_res = r_max + 1 - r_min
     assert num_configs > 0, "targets must not be empty"
-    compute_wtw = targets[0].shape[1] == 1
+    num_fantasy_samples = targets[0].shape[1]
+    compute_wtw = num_fantasy_samples == 1
     # Compute Cholesky factor for largest target vector size
     ydims = [y.shape[0] for y in targets]
-    rvals = _colvec(anp.arange(r_min, r_min + num_res))
-    means_all = _flatvec(res_kernel.mean_function(rvals))
-    amat = res_kernel(rvals, rvals) / noise_variance + anp.diag(anp.ones(num_res))
-    # TODO: Do we need AddJitterOp here?
-    lfact_all = cholesky_factorization(amat)  # L (Cholesky factor)
-    # Outer loop over configurations
+    lfact_all, means_all = _cholfact_and_means(res_kernel, noise_variance, num_res)
+    # Group configurations by target vector size, so that all solves for the
+    # same size are done in a single `solve_triangular` call
+    configs_for_ydim = dict()
+    for i, ydim in enumerate(ydims):
+        assert 0 < ydim <= num_res, f"len(y[{i}]) = {ydim}, num_res = {num_res}"
+        configs_for_ydim.setdefault(ydim, []).append(i)
+    # Dense padded copy of `targets`, so the right-hand sides per group are
+    # gathered by fancy indexing instead of Python-level concatenation
+    dense = np.zeros((num_configs, max(ydims), num_fantasy_samples))
+    for i, y in enumerate(targets):
+        dense[i, : y.shape[0], :] = y
+    # Loop over distinct target vector sizes
     vtv_lst = []
     wtv_lst = []
     wtw_lst = []
-    num_data = 0
-    for i, (ymat, ydim) in enumerate(zip(targets, ydims)):
-        assert 0 < ydim <= num_res, f"len(y[{i}]) = {ydim}, num_res = {num_res}"
-        num_data += ydim
+    index_lst = []
+    for ydim, config_inds in configs_for_ydim.items():
+        num = len(config_inds)
+        index_lst.extend(config_inds)
         lfact = lfact_all[:ydim, :ydim]
         rhs = anp.ones((ydim, 1))
         vvec = _flatvec(solve_triangular(lfact, rhs, lower=True))
-        means = means_all[:ydim]
-        rhs = ymat - _colvec(means)
+        # The columns of `rhs` are the target vectors (fantasy columns
+        # flattened out), so one triangular solve covers all configurations
+        # of this size
+        ymat = dense[config_inds, :ydim, :].transpose((1, 0, 2))
+        rhs = ymat.reshape((ydim, num * num_fantasy_samples)) - _colvec(
+            means_all[:ydim]
+        )
         wmat = solve_triangular(lfact, rhs, lower=True)
-        vtv_lst.append(_squared_norm(vvec))
-        wtv_lst.append(anp.matmul(_rowvec(vvec), wmat))
+        vtv_lst.append(anp.full(num, _squared_norm(vvec)))
+        wtv_lst.append(
+            anp.reshape(anp.matmul(_rowvec(vvec), wmat), (num, num_fantasy_samples))
+        )
         if compute_wtw:
-            wtw_lst.append(_squared_norm(wmat))
+            wtw_lst.append(anp.einsum("ij,ij->j", wmat, wmat))
+    # Scatter results back into the original ordering
+    inverse_perm = np.argsort(np.array(index_lst))
+    num_data = sum(ydims)
     # Compile results
     result = {
         "num_data": num_data,
-        "vtv": anp.array(vtv_lst),
-        "wtv": anp.vstack(wtv_lst),
+        "vtv": anp.concatenate(vtv_lst)[inverse_perm],
+        "wtv": anp.concatenate(wtv_lst, axis=0)[inverse_perm],
         "lfact_all": lfact_all,
         "means_all": means_all,
         "ydims": ydims,
     }
     if compute_wtw:
-        result["wtw"] = anp.array(wtw_lst)
+        result["wtw"] = anp.concatenate(wtw_lst)[inverse_perm]
     if not skip_c_d:
         result["c"] = anp.zeros(num_configs)
         result["d"] = anp.zeros(num_configs)
@@ -155,10 +155,10 @@ def sample_posterior_marginals(
     )
     post_means = anp.expand_dims(post_means, axis=-1)  # (n_test, m, 1)
     post_stds = anp.sqrt(anp.reshape(post_vars, (-1, 1, 1)))  # (n_test, 1, 1)
-    n01_vecs = [
-        random_state.normal(size=getval(post_means.shape)) for _ in range(num_samples)
-    ]
-    n01_mat = anp.concatenate(n01_vecs, axis=-1)
+    # all samples are drawn with a single RNG call and broadcast, instead of
+    # one call per sample
+    n_test, num_m, _ = getval(post_means.shape)
+    n01_mat = random_state.normal(size=(n_test, num_m, num_samples))
     samples = anp.multiply(n01_mat, post_stds) + post_means
 
     if samples.shape[1] == 1:
@@ -214,11 +214,12 @@ def sample_posterior_joint(
     # Reshape to (n_test, m, 1)
     n_test = getval(posterior_mean.shape)[0]
     posterior_mean = anp.expand_dims(posterior_mean, axis=-1)
-    n01_vecs = [
-        random_state.normal(size=getval(posterior_mean.shape))
-        for _ in range(num_samples)
-    ]
-    n01_mat = anp.reshape(anp.concatenate(n01_vecs, axis=-1), (n_test, -1))
+    # all samples are drawn with a single RNG call, instead of one call
+    # per sample
+    num_m = getval(posterior_mean.shape)[1]
+    n01_mat = anp.reshape(
+        random_state.normal(size=(n_test, num_m, num_samples)), (n_test, -1)
+    )
     samples = anp.reshape(anp.dot(lfact, n01_mat), (n_test, -1, num_samples))
     samples = samples + posterior_mean
 
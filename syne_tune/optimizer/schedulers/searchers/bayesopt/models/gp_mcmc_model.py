@@ -68,6 +68,9 @@ class GaussProcMCMCModelFactory(GaussProcModelFactory):
             filter_observed_data=filter_observed_data,
             hp_ranges_for_prediction=hp_ranges_for_prediction,
         )
+        # immutable after construction, cached here since
+        # `_get_num_fantasy_samples` sits on the acquisition hot path
+        self._num_fantasy_samples = gpmodel.number_samples
 
     def get_params(self):
         return dict()  # Model has no parameters to be fit
@@ -76,7 +79,7 @@ class GaussProcMCMCModelFactory(GaussProcModelFactory):
         pass  # Model has no parameters to fit
 
     def _get_num_fantasy_samples(self) -> int:
-        return self._gpmodel.number_samples
+        return self._num_fantasy_samples
 
     def _num_samples_for_fantasies(self) -> int:
         assert not self._gpmodel.multiple_targets()  # Sanity check
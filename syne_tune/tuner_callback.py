@@ -127,6 +127,9 @@ class StoreResultsCallback(TunerCallback):
         self.save_results_at_frequency = None
         self.add_wallclock_time = add_wallclock_time
         self._start_time_stamp = None
+        self._num_stored = 0
+        self._csv_columns = None
+        self._csv_zip_file = None
 
     def _set_time_fields(self, result: dict):
         """
@@ -157,19 +160,45 @@ class StoreResultsCallback(TunerCallback):
 
     def store_results(self):
         """
-        Store current results into CSV file, of name
-        `{tuner.tuner_path}/results.csv.zip`.
+        Appends results received since the last call to the CSV file, of name
+        `{tuner.tuner_path}/results.csv`. Appending keeps the I/O cost linear
+        in the number of results over the tuning run, the compressed
+        `results.csv.zip` is written once at the end of tuning.
         """
-        if self.csv_file is not None:
-            self.dataframe().to_csv(self.csv_file, index=False)
+        if self.csv_file is None:
+            return
+        new_results = self.results[self._num_stored :]
+        if not new_results:
+            return
+        first_write = self._num_stored == 0
+        if not first_write:
+            # appended rows must match the header written previously; if a
+            # result introduces new columns we fall back to a full rewrite
+            new_columns = set().union(*(result.keys() for result in new_results))
+            if not new_columns.issubset(self._csv_columns):
+                first_write = True
+                new_results = self.results
+        df = pd.DataFrame(new_results)
+        if first_write:
+            self._csv_columns = list(df.columns)
+            df.to_csv(self.csv_file, index=False)
+        else:
+            df.reindex(columns=self._csv_columns).to_csv(
+                self.csv_file, index=False, mode="a", header=False
+            )
+        self._num_stored = len(self.results)
 
     def dataframe(self) -> pd.DataFrame:
         return pd.DataFrame(self.results)
 
     def on_tuning_start(self, tuner):
         # we set the path of the csv file once the tuner is created since the path may change when the tuner is stop
-        # and resumed again on a different machine.
-        self.csv_file = str(tuner.tuner_path / "results.csv.zip")
+        # and resumed again on a different machine. Starting (or resuming)
+        # rewrites the csv file from scratch, after which results are appended.
+        self.csv_file = str(tuner.tuner_path / "results.csv")
+        self._csv_zip_file = str(tuner.tuner_path / "results.csv.zip")
+        self._num_stored = 0
+        self._csv_columns = None
 
         # we only save results every `results_update_frequency` seconds as this operation
         # may be expensive on remote storage.
@@ -184,3 +213,7 @@ class StoreResultsCallback(TunerCallback):
         # store the results in case some results were not committed yet (since they are saved every
         # `results_update_interval` seconds)
         self.store_results()
+        # the compressed copy is the artifact documented and synced to S3,
+        # it is written only once here as zip files cannot be appended to
+        if self._csv_zip_file is not None:
+            self.dataframe().to_csv(self._csv_zip_file, index=False)
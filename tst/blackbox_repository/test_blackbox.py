@@ -18,7 +18,7 @@ import pandas as pd
 import syne_tune.config_space as sp
 
 from syne_tune.blackbox_repository import BlackboxOffline
-from syne_tune.blackbox_repository.blackbox import from_function
+from syne_tune.blackbox_repository.blackbox import Blackbox, from_function
 from syne_tune.blackbox_repository.blackbox_tabular import BlackboxTabular
 from syne_tune.blackbox_repository.blackbox_offline import (
     deserialize as deserialize_offline,
@@ -122,6 +122,80 @@ def test_blackbox_fidelity():
         assert (res == should_be).all()
 
 
+def test_blackbox_fidelity_space_reassignment():
+    # Mirrors the YAHPO wrapper flow: the subclass narrows the fidelity space
+    # to a single fidelity after `super().__init__`. The cached key views must
+    # be refreshed, so that numeric fidelity values are accepted afterwards
+    class BB(Blackbox):
+        def __init__(self):
+            super().__init__(
+                configuration_space=cs,
+                fidelity_space={
+                    "hp_epoch": sp.randint(0, n_epochs),
+                    "repl": sp.randint(10, 10),
+                },
+            )
+            fidelity_space = dict(self.fidelity_space)
+            del fidelity_space["repl"]
+            self.fidelity_space = fidelity_space
+
+        def _objective_function(
+            self,
+            configuration: dict,
+            fidelity=None,
+            seed=None,
+        ):
+            return {
+                "metric_rmse": configuration["hp_x1"] * configuration["hp_x2"]
+                + fidelity["hp_epoch"]
+            }
+
+    blackbox = BB()
+    res = blackbox.objective_function({"hp_x1": 2, "hp_x2": 3}, fidelity=1)
+    assert res["metric_rmse"] == 2 * 3 + 1
+    res = blackbox.objective_function(
+        {"hp_x1": 2, "hp_x2": 3}, fidelity={"hp_epoch": 2}
+    )
+    assert res["metric_rmse"] == 2 * 3 + 2
+
+    # Mirrors `BlackBoxYAHPO.set_instance`: adding a key to the configuration
+    # space by reassignment must refresh the cached keys as well
+    blackbox.configuration_space = {
+        **blackbox.configuration_space,
+        "hp_x3": sp.randint(0, 2),
+    }
+    res = blackbox.objective_function({"hp_x1": 2, "hp_x2": 3, "hp_x3": 1}, fidelity=1)
+    assert res["metric_rmse"] == 2 * 3 + 1
+
+
+def test_blackbox_objective_function_batch():
+    # build dummy values for fidelities
+    fidelities = []
+    for fidelity in range(n_epochs):
+        dummy_y = x1 * x2 + fidelity
+        fidelity_vec = np.ones_like(x1) * fidelity
+        fidelities.append(np.stack([x1, x2, fidelity_vec, dummy_y]).T)
+    data = np.vstack(fidelities)
+
+    df = pd.DataFrame(data=data, columns=["hp_x1", "hp_x2", "hp_epoch", "metric_rmse"])
+
+    blackbox = BlackboxOffline(
+        df_evaluations=df, configuration_space=cs, fidelity_space=cs_fidelity
+    )
+
+    configurations = pd.DataFrame({"hp_x1": x1, "hp_x2": x2})
+    epochs = np.arange(n) % n_epochs
+    res = blackbox.objective_function_batch(configurations, fidelities=epochs)
+    assert res.shape == (n, 1)
+    assert np.allclose(res[:, 0], x1 * x2 + epochs)
+
+    # without fidelities, all fidelities are returned per configuration
+    res = blackbox.objective_function_batch(configurations)
+    assert res.shape == (n, n_epochs, 1)
+    should_be = (x1 * x2).reshape((-1, 1)) + np.arange(n_epochs)
+    assert np.allclose(res[:, :, 0], should_be)
+
+
 def test_blackbox_seed():
     # build dummy values for seeds
     n_seeds = 4
@@ -246,6 +320,42 @@ def test_blackbox_tabular_serialization():
         #    assert res['metric_rmse'] == u * v
 
 
+def test_blackbox_tabular_objective_function_batch():
+    data = np.stack([x1, x2]).T
+    hyperparameters = pd.DataFrame(data=data, columns=["hp_x1", "hp_x2"])
+    num_seeds = 2
+    num_fidelities = 5
+    num_objectives = 2
+
+    objectives_evaluations = np.random.rand(
+        len(hyperparameters), num_seeds, num_fidelities, num_objectives
+    )
+
+    blackbox = BlackboxTabular(
+        hyperparameters=hyperparameters,
+        configuration_space=cs,
+        fidelity_space=cs_fidelity,
+        objectives_evaluations=objectives_evaluations,
+        objectives_names=["a", "b"],
+    )
+
+    configurations = pd.DataFrame({"hp_x1": x1, "hp_x2": x2})
+    fidelities = np.arange(n) % num_fidelities + 1
+    seed = num_seeds - 1
+    res = blackbox.objective_function_batch(
+        configurations, fidelities=fidelities, seed=seed
+    )
+    assert res.shape == (n, num_objectives)
+    assert np.allclose(
+        res, objectives_evaluations[np.arange(n), seed, fidelities - 1, :]
+    )
+
+    # without fidelities, all fidelities are returned per configuration
+    res = blackbox.objective_function_batch(configurations, seed=seed)
+    assert res.shape == (n, num_fidelities, num_objectives)
+    assert np.allclose(res, objectives_evaluations[:, seed, :, :])
+
+
 def test_blackbox_tabular():
     data = np.stack([x1, x2]).T
     hyperparameters = pd.DataFrame(data=data, columns=["hp_x1", "hp_x2"])